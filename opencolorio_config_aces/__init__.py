@@ -20,53 +20,6 @@ Sub-packages
 -   utilities: Various utilities and data structures.
 """
 
-from .config import (
-    TRANSFORM_FACTORIES,
-    colorspace_factory,
-    group_transform_factory,
-    look_factory,
-    named_transform_factory,
-    produce_transform,
-    transform_factory,
-    transform_factory_clf_transform_to_group_transform,
-    transform_factory_default,
-    view_transform_factory,
-)
-from .config import (
-    ConfigData,
-    VersionData,
-    deserialize_config_data,
-    generate_config,
-    serialize_config_data,
-    validate_config,
-)
-from .config import (
-    build_aces_conversion_graph,
-    classify_aces_ctl_transforms,
-    conversion_path,
-    ctl_transform_to_node,
-    discover_aces_ctl_transforms,
-    filter_ctl_transforms,
-    filter_nodes,
-    node_to_ctl_transform,
-    plot_aces_conversion_graph,
-    print_aces_taxonomy,
-    unclassify_ctl_transforms,
-)
-from .config import (
-    ColorspaceDescriptionStyle,
-    generate_config_aces,
-)
-from .config import generate_config_cg
-from .clf import (
-    discover_clf_transforms,
-    classify_clf_transforms,
-    unclassify_clf_transforms,
-    filter_clf_transforms,
-    print_clf_taxonomy,
-)
-from .clf import generate_clf
-
 __author__ = "OpenColorIO Contributors"
 __copyright__ = "Copyright Contributors to the OpenColorIO Project."
 __license__ = "New BSD License - https://opensource.org/licenses/BSD-3-Clause"
@@ -74,7 +27,7 @@ __maintainer__ = "OpenColorIO Contributors"
 __email__ = "ocio-dev@lists.aswf.io"
 __status__ = "Production"
 
-__all__ = [
+__all__ = (
     "TRANSFORM_FACTORIES",
     "colorspace_factory",
     "group_transform_factory",
@@ -85,16 +38,12 @@ __all__ = [
     "transform_factory_clf_transform_to_group_transform",
     "transform_factory_default",
     "view_transform_factory",
-]
-__all__ += [
     "ConfigData",
     "VersionData",
     "deserialize_config_data",
     "generate_config",
     "serialize_config_data",
     "validate_config",
-]
-__all__ += [
     "build_aces_conversion_graph",
     "classify_aces_ctl_transforms",
     "conversion_path",
@@ -106,20 +55,122 @@ __all__ += [
     "plot_aces_conversion_graph",
     "print_aces_taxonomy",
     "unclassify_ctl_transforms",
-]
-__all__ += [
     "ColorspaceDescriptionStyle",
     "generate_config_aces",
-]
-__all__ += ["generate_config_cg"]
-__all__ += [
+    "generate_config_cg",
     "discover_clf_transforms",
     "classify_clf_transforms",
     "unclassify_clf_transforms",
     "filter_clf_transforms",
     "print_clf_taxonomy",
-]
-__all__ += ["generate_clf"]
+    "generate_clf",
+)
+
+_LAZY_IMPORTS = {
+    "TRANSFORM_FACTORIES": "config",
+    "colorspace_factory": "config",
+    "group_transform_factory": "config",
+    "look_factory": "config",
+    "named_transform_factory": "config",
+    "produce_transform": "config",
+    "transform_factory": "config",
+    "transform_factory_clf_transform_to_group_transform": "config",
+    "transform_factory_default": "config",
+    "view_transform_factory": "config",
+    "ConfigData": "config",
+    "VersionData": "config",
+    "deserialize_config_data": "config",
+    "generate_config": "config",
+    "serialize_config_data": "config",
+    "validate_config": "config",
+    "build_aces_conversion_graph": "config",
+    "classify_aces_ctl_transforms": "config",
+    "conversion_path": "config",
+    "ctl_transform_to_node": "config",
+    "discover_aces_ctl_transforms": "config",
+    "filter_ctl_transforms": "config",
+    "filter_nodes": "config",
+    "node_to_ctl_transform": "config",
+    "plot_aces_conversion_graph": "config",
+    "print_aces_taxonomy": "config",
+    "unclassify_ctl_transforms": "config",
+    "ColorspaceDescriptionStyle": "config",
+    "generate_config_aces": "config",
+    "generate_config_cg": "config",
+    "discover_clf_transforms": "clf",
+    "classify_clf_transforms": "clf",
+    "unclassify_clf_transforms": "clf",
+    "filter_clf_transforms": "clf",
+    "print_clf_taxonomy": "clf",
+    "generate_clf": "clf",
+}
+"""
+Mapping of the lazily imported attributes to the sub-packages defining them.
+
+_LAZY_IMPORTS : dict
+"""
+
+if set(_LAZY_IMPORTS) != set(__all__):  # pragma: no cover
+    raise RuntimeError(
+        '"_LAZY_IMPORTS" and "__all__" must define the same attributes!'
+    )
+
+_SUB_PACKAGES = ("clf", "config", "utilities")
+"""
+Sub-packages imported on first access.
+
+_SUB_PACKAGES : tuple
+"""
+
+
+def __getattr__(name):
+    """
+    Import the given attribute or sub-package on first access, so that the
+    sub-packages and their dependencies are only imported when required.
+
+    Parameters
+    ----------
+    name : unicode
+        Attribute name.
+
+    Returns
+    -------
+    object
+        Attribute value.
+
+    Raises
+    ------
+    AttributeError
+        If the attribute does not exist.
+    """
+
+    import importlib
+
+    if name in _SUB_PACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """
+    Return the module attributes including the lazily imported ones.
+
+    Returns
+    -------
+    list
+        Module attributes.
+    """
+
+    return sorted(set(globals()) | set(__all__) | set(_SUB_PACKAGES))
+
 
 __application_name__ = "OpenColorIO Configuration for ACES"
 
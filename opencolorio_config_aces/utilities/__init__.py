@@ -3,6 +3,7 @@
 
 from .common import (
     DocstringDict,
+    docstring_dict,
     first_item,
     common_ancestor,
     paths_common_ancestor,
@@ -23,6 +24,7 @@ from .common import (
 
 __all__ = [
     "DocstringDict",
+    "docstring_dict",
     "first_item",
     "common_ancestor",
     "paths_common_ancestor",
@@ -25,6 +25,7 @@ __status__ = "Production"
 
 __all__ = [
     "DocstringDict",
+    "docstring_dict",
     "first_item",
     "common_ancestor",
     "paths_common_ancestor",
@@ -61,11 +62,74 @@ class DocstringDict(dict):
     """
     A :class:`dict` sub-class that allows settings a docstring to :class:`dict`
     instances.
+
+    Notes
+    -----
+    -   Instances with a class-level docstring can be created with the
+        :func:`opencolorio_config_aces.utilities.docstring_dict` definition.
     """
 
     pass
 
 
+class _DocumentedDocstringDict(DocstringDict):
+    """
+    Base class of the :class:`opencolorio_config_aces.utilities.DocstringDict`
+    sub-classes created by the
+    :func:`opencolorio_config_aces.utilities.docstring_dict` definition.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        """
+        Rebuild the instance with the
+        :func:`opencolorio_config_aces.utilities.docstring_dict` definition as
+        its class is not reachable from the module.
+        """
+
+        return docstring_dict, (dict(self), type(self).__doc__)
+
+
+def docstring_dict(mapping, docstring):
+    """
+    Return a :class:`opencolorio_config_aces.utilities.DocstringDict` class
+    instance with given docstring.
+
+    The docstring is stored on a dedicated
+    :class:`opencolorio_config_aces.utilities.DocstringDict` sub-class, named
+    *DocumentedDocstringDict*, rather than on the instance.
+
+    Parameters
+    ----------
+    mapping : dict
+        Mapping to initialise the instance with.
+    docstring : unicode
+        Instance docstring.
+
+    Returns
+    -------
+    DocstringDict
+        Instance with given docstring.
+
+    Examples
+    --------
+    >>> mapping = docstring_dict({'a': 1}, 'Docstring.')
+    >>> mapping
+    {'a': 1}
+    >>> mapping.__doc__
+    'Docstring.'
+    >>> type(mapping).__name__
+    'DocumentedDocstringDict'
+    """
+
+    return type(
+        f"Documented{DocstringDict.__name__}",
+        (_DocumentedDocstringDict,),
+        {"__doc__": docstring, "__slots__": ()},
+    )(mapping)
+
+
 def first_item(iterable, default=None):
     """
     Return the first item of given iterable.
@@ -81,13 +145,19 @@ def first_item(iterable, default=None):
     -------
     object
         First iterable item.
+
+    Examples
+    --------
+    >>> first_item(['a', 'b', 'c'])
+    'a'
+    >>> first_item(iter([]), 'z')
+    'z'
     """
 
-    if not iterable:
+    if iterable is None:
         return default
 
-    for item in iterable:
-        return item
+    return next(iter(iterable), default)
 
 
 def common_ancestor(*args):
@@ -112,15 +182,63 @@ def common_ancestor(*args):
     'aze'
     """
 
-    array = list(map(set, zip(*args)))
-    divergence = list(filter(lambda i: len(i) > 1, array))
+    first = first_item(args)
 
-    if divergence:
-        ancestor = first_item(args)[: array.index(first_item(divergence))]
-    else:
-        ancestor = min(args)
+    for i, column in enumerate(zip(*args)):
+        item = column[0]
+        for other in column:
+            if other != item:
+                return first[:i]
 
-    return ancestor
+    return min(args)
+
+
+def _longest_common_path(paths):
+    """
+    Return the longest common path, component-wise, of given paths.
+
+    The paths are compared in-place, one component of the first path at a
+    time, thus without splitting them into components.
+
+    Parameters
+    ----------
+    paths : tuple or list
+        Paths to retrieve the longest common path from.
+
+    Returns
+    -------
+    unicode
+        Longest common path.
+    """
+
+    first, others = paths[0], paths[1:]
+
+    start = 0
+    while True:
+        end = first.find(os.sep, start)
+        if end == -1:
+            end = len(first)
+
+        # The previous components have already been compared, only the
+        # current one needs to be.
+        segment = first[start:end]
+        exhausted = end == len(first)
+        for path in others:
+            if not path.startswith(segment, start):
+                break
+
+            if len(path) == end:
+                exhausted = True
+            elif path[end] != os.sep:
+                break
+        else:
+            if exhausted:
+                return first[:end]
+
+            start = end + 1
+            continue
+
+        return first[: start - 1] if start else ""
 
 
 def paths_common_ancestor(*args):
@@ -144,11 +262,23 @@ def paths_common_ancestor(*args):
     '/Users/JohnDoe/Documents'
     """
 
-    path_ancestor = os.sep.join(
-        common_ancestor(*[path.split(os.sep) for path in args])
-    )
+    return _longest_common_path(args)
+
+
+class _Vivified(dict):
+    """
+    A :class:`dict` sub-class creating and storing a new instance of itself
+    for any missing key.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        """Create, store and return a new instance for given missing key."""
+
+        value = self[key] = _Vivified()
 
-    return path_ancestor
+        return value
 
 
 def vivification():
@@ -158,19 +288,19 @@ def vivification():
 
     Returns
     -------
-    defaultdict
+    dict
 
     Examples
     --------
     >>> vivified = vivification()
     >>> vivified['my']['attribute'] = 1
-    >>> vivified['my']  # doctest: +SKIP
-    defaultdict(<function vivification at 0x...>, {u'attribute': 1})
+    >>> vivified['my']
+    {'attribute': 1}
     >>> vivified['my']['attribute']
     1
     """
 
-    return defaultdict(vivification)
+    return _Vivified()
 
 
 def vivified_to_dict(vivified):
@@ -179,7 +309,7 @@ def vivified_to_dict(vivified):
 
     Parameters
     ----------
-    vivified : defaultdict
+    vivified : dict or defaultdict
         Vivified data-structure.
 
     Returns
@@ -194,11 +324,45 @@ def vivified_to_dict(vivified):
     {u'my': {u'attribute': 1}}
     """
 
-    if isinstance(vivified, defaultdict):
-        vivified = {
-            key: vivified_to_dict(value) for key, value in vivified.items()
-        }
-    return vivified
+    if not isinstance(vivified, (_Vivified, defaultdict)):
+        return vivified
+
+    dictionary = {}
+    stack = [(vivified, dictionary)]
+    while stack:
+        node, output = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, (_Vivified, defaultdict)):
+                output[key] = {}
+                stack.append((value, output[key]))
+            else:
+                output[key] = value
+
+    return dictionary
+
+
+@functools.lru_cache(maxsize=8)
+def _text_wrapper(width):
+    """
+    Return a :class:`textwrap.TextWrapper` class instance for given width.
+
+    The instances are cached as their initialisation compiles various regular
+    expressions.
+
+    Parameters
+    ----------
+    width : int
+        Maximum length of the wrapped lines.
+
+    Returns
+    -------
+    TextWrapper
+        Text wrapper.
+    """
+
+    return TextWrapper(
+        width=width, break_long_words=False, replace_whitespace=False
+    )
 
 
 def message_box(message, width=79, padding=3, print_callable=print):
@@ -257,31 +421,30 @@ def message_box(message, width=79, padding=3, print_callable=print):
 
     ideal_width = width - padding * 2 - 2
 
+    bar = "=" * width
+    margin = " " * padding
+
     def inner(text):
         """Format and pads inner text for the message box."""
 
-        return "*{0}{1}{2}{0}*".format(
-            " " * padding, text, (" " * (width - len(text) - padding * 2 - 2))
-        )
+        return f"*{margin}{text.ljust(ideal_width)}{margin}*"
 
-    print_callable("=" * width)
+    print_callable(bar)
     print_callable(inner(""))
 
-    wrapper = TextWrapper(
-        width=ideal_width, break_long_words=False, replace_whitespace=False
-    )
+    wrapper = _text_wrapper(ideal_width)
 
-    lines = [wrapper.wrap(line) for line in message.split("\n")]
-    lines = [" " if len(line) == 0 else line for line in lines]
-    for line in chain(*lines):
+    lines = (wrapper.wrap(line) or [" "] for line in message.split("\n"))
+    for line in chain.from_iterable(lines):
         print_callable(inner(line.expandtabs()))
 
     print_callable(inner(""))
-    print_callable("=" * width)
+    print_callable(bar)
 
     return True
 
 
+@functools.lru_cache(maxsize=None)
 def is_colour_installed(raise_exception=False):
     """
     Return if *Colour* is installed and available.
@@ -309,13 +472,12 @@ def is_colour_installed(raise_exception=False):
     except ImportError as error:  # pragma: no cover
         if raise_exception:
             raise ImportError(
-                (
-                    '"Colour" related API features ' 'are not available: "{}".'
-                ).format(error)
+                f'"Colour" related API features are not available: "{error}".'
             )
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def is_jsonpickle_installed(raise_exception=False):
     """
     Return if *jsonpickle* is installed and available.
@@ -343,14 +505,13 @@ def is_jsonpickle_installed(raise_exception=False):
     except ImportError as error:  # pragma: no cover
         if raise_exception:
             raise ImportError(
-                (
-                    '"jsonpickle" related API features, e.g. serialization, '
-                    'are not available: "{}".'
-                ).format(error)
+                f'"jsonpickle" related API features, e.g. serialization, '
+                f'are not available: "{error}".'
             )
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def is_networkx_installed(raise_exception=False):
     """
     Return if *NetworkX* is installed and available.
@@ -379,27 +540,25 @@ def is_networkx_installed(raise_exception=False):
     except ImportError as error:  # pragma: no cover
         if raise_exception:
             raise ImportError(
-                (
-                    '"NetworkX" related API features '
-                    'are not available: "{}".'
-                ).format(error)
+                f'"NetworkX" related API features are not available: '
+                f'"{error}".'
             )
         return False
 
 
-REQUIREMENTS_TO_CALLABLE = DocstringDict(
+REQUIREMENTS_TO_CALLABLE = docstring_dict(
     {
         "Colour": is_colour_installed,
         "jsonpickle": is_jsonpickle_installed,
         "NetworkX": is_networkx_installed,
-    }
-)
-REQUIREMENTS_TO_CALLABLE.__doc__ = """
+    },
+    """
 Mapping of requirements to their respective callables.
 
 _REQUIREMENTS_TO_CALLABLE : CaseInsensitiveMapping
     **{'Colour', 'jsonpickle', 'NetworkX', 'OpenImageIO'}**
-"""
+""",
+)
 
 
 def required(*requirements):
@@ -415,17 +574,32 @@ def required(*requirements):
     Returns
     -------
     object
+
+    Notes
+    -----
+    -   The requirements are only checked until they are satisfied once.
     """
 
+    callables = tuple(
+        REQUIREMENTS_TO_CALLABLE[requirement] for requirement in requirements
+    )
+
     def wrapper(function):
         """Wrap given function wrapper."""
 
+        satisfied = False
+
         @functools.wraps(function)
         def wrapped(*args, **kwargs):
             """Wrap given function."""
 
-            for requirement in requirements:
-                REQUIREMENTS_TO_CALLABLE[requirement](raise_exception=True)
+            nonlocal satisfied
+
+            if not satisfied:
+                for callable_ in callables:
+                    callable_(raise_exception=True)
+
+                satisfied = True
 
             return function(*args, **kwargs)
 
@@ -456,7 +630,7 @@ def is_string(a):
     False
     """
 
-    return True if isinstance(a, str) else False
+    return isinstance(a, str)
 
 
 def is_iterable(a):
@@ -481,13 +655,17 @@ def is_iterable(a):
     False
     """
 
-    return is_string(a) or (True if getattr(a, "__iter__", False) else False)
+    return isinstance(a, str) or getattr(a, "__iter__", None) is not None
 
 
+@functools.lru_cache(maxsize=1)
 def git_describe():
     """
     Describe the current *OpenColorIO Configuration for ACES* *git* version.
 
+    The result is cached as the version does not change during the process
+    lifetime.
+
     Returns
     -------
     >>> git_describe()  # doctest: +SKIP
@@ -496,22 +674,23 @@ def git_describe():
 
     import opencolorio_config_aces
 
+    version = opencolorio_config_aces.__version__
+
     try:  # pragma: no cover
-        version = subprocess.check_output(
+        process = subprocess.run(
             ["git", "describe"],
             cwd=opencolorio_config_aces.__path__[0],
-            stderr=subprocess.STDOUT,
-        ).strip()
-        version = version.decode("utf-8")
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode == 0:
+            version = process.stdout.strip()
     except Exception:  # pragma: no cover
-        version = opencolorio_config_aces.__version__
+        pass
 
     return version
 
 
-# TODO: Numpy currently comes via "Colour", we might want that to be an
-# explicit dependency in the future.
-@required("Colour")
 def matrix_3x3_to_4x4(M):
     """
     Convert given 3x3 matrix :math:`M` to a raveled 4x4 matrix.
@@ -525,14 +704,106 @@ def matrix_3x3_to_4x4(M):
     -------
     list
         Raveled 4x4 matrix.
+
+    Examples
+    --------
+    >>> matrix_3x3_to_4x4(  # doctest: +NORMALIZE_WHITESPACE
+    ...     [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    [1.0, 2.0, 3.0, 0.0, 4.0, 5.0, 6.0, 0.0, 7.0, 8.0, 9.0, 0.0,
+     0.0, 0.0, 0.0, 1.0]
+    """
+
+    (M_0, M_1, M_2), (M_3, M_4, M_5), (M_6, M_7, M_8) = M
+
+    return [
+        float(M_0),
+        float(M_1),
+        float(M_2),
+        0.0,
+        float(M_3),
+        float(M_4),
+        float(M_5),
+        0.0,
+        float(M_6),
+        float(M_7),
+        float(M_8),
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        1.0,
+    ]
+
+
+_PATTERN_METACHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+"""
+Regular expression matching the metacharacters of a regular expression
+pattern, patterns without any of them are literal strings.
+
+_PATTERN_METACHARACTERS : Pattern
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_patterns(patterns):
     """
+    Compile given regular expression patterns and substitutions pairs.
+
+    The compiled patterns are cached so that repeated calls with the same
+    patterns, e.g. the module-level substitution tables, reuse them.
 
-    import numpy as np
+    Parameters
+    ----------
+    patterns : tuple
+        Regular expression patterns and substitutions pairs.
 
-    M_I = np.identity(4)
-    M_I[:3, :3] = M
+    Returns
+    -------
+    tuple
+        Alternation of all the patterns, or *None* if they cannot be
+        combined, and patterns, substitutions and literal flags triplets.
+        Literal patterns are kept as strings, the other ones are compiled.
+
+    Notes
+    -----
+    -   The alternation is only used to detect in a single pass whether any of
+        the patterns matches. It cannot replace the sequential substitutions
+        because each pattern applies onto the result of the previous ones.
+    -   Patterns defining groups are not combined as the group numbers, and
+        thus the backreferences, would be shifted in the alternation.
+    -   Patterns using global inline flags, e.g. ``(?i)`` or ``(?x)``, are
+        not combined as the flags would apply to the whole alternation.
+    -   Literal patterns with a literal substitution, i.e. without escapes,
+        are applied with :meth:`str.replace`.
+    """
+
+    compiled = []
+    for pattern, substitution in patterns:
+        literal = (
+            _PATTERN_METACHARACTERS.search(pattern) is None
+            and isinstance(substitution, str)
+            and "\\" not in substitution
+        )
+        compiled.append(
+            (
+                pattern if literal else re.compile(pattern),
+                substitution,
+                literal,
+            )
+        )
+    compiled = tuple(compiled)
+
+    alternation = None
+    if compiled and not any(
+        pattern.groups or pattern.flags & ~re.UNICODE
+        for pattern, _, literal in compiled
+        if not literal
+    ):
+        alternation = re.compile(
+            "|".join(f"(?:{pattern})" for pattern, _ in patterns)
+        )
 
-    return np.ravel(M_I).tolist()
+    return alternation, compiled
 
 
 def multi_replace(name, patterns):
@@ -559,9 +830,23 @@ def multi_replace(name, patterns):
     ...     'Canon Luke Skywalker was weak and powerless.',
     ...     {'Canon': 'Legends', 'weak': 'strong', '\\w+less': 'powerful'})
     'Legends Luke Skywalker was strong and powerful.'
+    >>> multi_replace('Luke Skywalker', {'Canon': 'Legends', '\\w+less': ''})
+    'Luke Skywalker'
+    >>> multi_replace('Luke Skywalker', {'Luke': 'Ben', 'Sky': 'Moon'})
+    'Ben Moonwalker'
+    >>> multi_replace('Luke Skywalker', {'(?x) Dark Side': '', 'Luke': 'Ben'})
+    'Ben Skywalker'
     """
 
-    for pattern, substitution in patterns.items():
-        name = re.sub(pattern, substitution, name)
+    alternation, compiled = _compile_patterns(tuple(patterns.items()))
+
+    if alternation is not None and alternation.search(name) is None:
+        return name
+
+    for pattern, substitution, literal in compiled:
+        if literal:
+            name = name.replace(pattern, substitution)
+        else:
+            name = pattern.sub(substitution, name)
 
     return name